@@ -6,6 +6,7 @@ representation of a dataset found in .data.
 
 from __future__ import annotations as _annotations
 from typing import NoReturn
+import os as _os
 import pandas as _pd
 
 
@@ -27,24 +28,30 @@ class PandasLoader():
         """
         self._depth: int = depth
         self._data_path: str = data_path
+        # both are fixed once initialised, so build them once here
+        self._path: str = '../' * depth + data_path + '/'
+        self._desc_path: str = self._path + 'descriptions/'
 
     @property
     def PATH(self) -> str:
-        counter: int = 0
-        rel_path: str = ''
-        while counter < self._depth:
-            rel_path = rel_path + '../'
-            counter += 1
-        return rel_path + self._data_path + '/'
+        return self._path
 
     @property
     def DESC_PATH(self) -> str:
-        counter: int = 0
-        rel_path: str = ''
-        while counter < self._depth:
-            rel_path = rel_path + '../'
-            counter += 1
-        return rel_path + self._data_path + '/descriptions/'
+        return self._desc_path
+
+    @staticmethod
+    def _is_file_in(dir_path: str, name: str) -> bool:
+        """
+        Returns:
+            `True` if `name` is a file directly inside `dir_path`, \
+                otherwise `False`
+        """
+        # names reaching into a subdirectory are not in the dir itself
+        return (
+            _os.path.basename(name) == name
+            and _os.path.isfile(dir_path + name)
+        )
 
     def get(self, f: str) -> _pd.DataFrame:
         """
@@ -63,7 +70,7 @@ class PandasLoader():
         Returns:
             a **Pandas** `DataFrame` representation of the csv file
         """
-        assert f + '.csv' in self.list_files(), (
+        assert self._is_file_in(self.PATH, f + '.csv'), (
             f"{f + '.csv'} is not in the data dir, use list_files() to check"
         )
         return _pd.read_csv(self.PATH + f + '.csv')
@@ -73,8 +80,7 @@ class PandasLoader():
         Returns:
             a list of all current files in the data directory
         """
-        from os import listdir
-        return listdir(self.PATH)
+        return _os.listdir(self.PATH)
 
     def get_description(self, f: str) -> NoReturn:
         """Print a description of the data.
@@ -86,12 +92,8 @@ class PandasLoader():
             AssertionError: if arg `f` is not the file name of a csv file\
                 in the data dir
         """
-        from os import listdir
-        assert f + '.txt' in listdir(self.DESC_PATH), (
+        assert self._is_file_in(self.DESC_PATH, f + '.txt'), (
             f"No description available for {f}."
         )
-        out = ""
         with open(f'{self.DESC_PATH + f}.txt') as desc_file:
-            for line in desc_file.readlines():
-                out += line
-        print(out)
+            print(desc_file.read())
@@ -0,0 +1,54 @@
+"""
+`opyn.stats.dataclasses`
+
+Lightweight result types returned by the functions in `opyn.stats`.
+
+Each is a `NamedTuple`, so results can be unpacked or indexed like a
+tuple, and `to_frame()` gives a one-row **Pandas** `DataFrame` of the
+results.
+"""
+
+
+from __future__ import annotations
+from typing import NamedTuple
+import pandas as pd
+
+
+def _result_frame(res: NamedTuple) -> pd.DataFrame:
+    """Return a result as a one-row **Pandas** `DataFrame`."""
+    return pd.DataFrame([tuple(res)], columns=res._fields, index=["result"])
+
+
+class ChiSqTest(NamedTuple):
+    """Test statistic and p-value of a chi-squared test."""
+    chisq: float
+    pval: float
+    to_frame = _result_frame
+
+
+class ContingencyTest(NamedTuple):
+    """Results of a chi-squared test of no association."""
+    chisq: float
+    pval: float
+    df: int
+    to_frame = _result_frame
+
+
+class OddsRatio(NamedTuple):
+    """Point and confidence interval estimates for an odds ratio."""
+    oddsratio: float
+    stderr: float
+    lower: float
+    upper: float
+    to_frame = _result_frame
+
+
+class MatchedOddsRatio(NamedTuple):
+    """Point and confidence interval estimates for the odds ratio in a 1-1
+    matched case-control study.
+    """
+    oddsratio: float
+    stderr: float
+    lcb: float
+    ucb: float
+    to_frame = _result_frame
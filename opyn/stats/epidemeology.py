@@ -13,10 +13,160 @@ Dependencies:
 
 from __future__ import annotations as _annotations
 import math as _math
+from functools import lru_cache as _lru_cache
 from scipy import stats as _st
 from statsmodels.stats import contingency_tables as _tables
 import pandas as _pd
 import numpy as _np
+from . import dataclasses as _dataclasses
+
+
+# a single frozen standard normal, rather than one per call
+_NORM = _st.norm()
+
+
+@_lru_cache(maxsize=128)
+def _z(alpha: float) -> float:
+    """Return the z-value for a two-sided (1-alpha)% confidence interval.
+
+    Values are memoised, as the same few significance levels are used
+    over and over.
+    """
+    return float(_NORM.ppf(1-alpha/2))
+
+
+def _chisq1_sf(chisq: float) -> float:
+    """Return the p-value of a chi-squared statistic on 1 degree of freedom.
+
+    For 1 df, the survival function reduces to erfc(sqrt(x/2)).
+    """
+    return _math.erfc(_math.sqrt(chisq / 2))
+
+
+def _prepare(obs: _np.ndarray) -> _np.ndarray:
+    """Return `obs` as a C-contiguous float64 array, copying only if it is
+    not one already.
+    """
+    return _np.ascontiguousarray(obs, dtype=_np.float64)
+
+
+def _stratifiedtable(obs: _np.ndarray) -> _tables.StratifiedTable:
+    """Return a **statsmodels** `StratifiedTable` of a Kx2x2 array.
+
+    The strata are moved to the last axis, the 2x2xK layout statsmodels
+    takes as is, instead of going through a nested list.
+    """
+    return _tables.StratifiedTable(_np.moveaxis(_np.asarray(obs), 0, -1))
+
+
+def _strata_cells(obs: _np.ndarray) -> tuple[_np.ndarray, ...]:
+    """Return the a, b, c, d cells and the total of each stratum of a
+    Kx2x2 array.
+    """
+    obs = _prepare(obs)
+    return (
+        obs[:, 0, 0], obs[:, 0, 1], obs[:, 1, 0], obs[:, 1, 1],
+        obs.sum((1, 2))
+    )
+
+
+def _logratio_ci(
+    est: _np.ndarray, stderr: _np.ndarray, z: float
+) -> tuple[_np.ndarray, _np.ndarray]:
+    """Return the bounds of the Wald confidence interval of a ratio whose
+    log has standard error `stderr`.
+    """
+    factor = _np.exp(z * stderr)
+    return est / factor, est * factor
+
+
+def _riskratios(obs: _np.ndarray) -> tuple[_np.ndarray, _np.ndarray]:
+    """Return the risk ratios and log standard errors of each exposure
+    against the reference category in the first row.
+
+    Any leading axes of `obs` are treated as a stack of tables.
+    """
+    a = obs[..., :1, 1]
+    n1 = obs[..., :1, :].sum(-1)
+    c = obs[..., 1:, 1]
+    n2 = obs[..., 1:, :].sum(-1)
+    rr = (c/n2) / (a/n1)
+    stderr = _np.sqrt((1/a - 1/n1) + (1/c - 1/n2))
+    return rr, stderr
+
+
+def _oddsratios(obs: _np.ndarray) -> tuple[_np.ndarray, _np.ndarray]:
+    """Return the odds ratios and log standard errors of each exposure
+    against the reference category in the first row.
+
+    Any leading axes of `obs` are treated as a stack of tables.
+    """
+    a, b = obs[..., :1, 0], obs[..., :1, 1]
+    c, d = obs[..., 1:, 0], obs[..., 1:, 1]
+    or_ = (a * d) / (b * c)
+    stderr = _np.sqrt(1/a + 1/b + 1/c + 1/d)
+    return or_, stderr
+
+
+def _ratio_records(
+    name: str, est: _np.ndarray, stderr: _np.ndarray, z: float
+) -> _np.ndarray:
+    """Return the estimates of a ratio as a structured array."""
+    lower, upper = _logratio_ci(est, stderr, z)
+    res = _np.empty(est.shape, dtype=[
+        (name, "f8"), ("stderr", "f8"), ("lower", "f8"), ("upper", "f8")
+    ])
+    res[name], res["stderr"] = est, stderr
+    res["lower"], res["upper"] = lower, upper
+    return res
+
+
+def _ratio_frame(
+    name: str, est: _np.ndarray, stderr: _np.ndarray, z: float
+) -> _pd.DataFrame:
+    """Return the estimates of a ratio for each exposure against the
+    reference category, which is placed in the first row.
+    """
+    lower, upper = _logratio_ci(est, stderr, z)
+    return _pd.DataFrame(
+        {
+            name: [1.0, *est],
+            "stderr": [0.0, *stderr],
+            "lower": ["NA", *lower],
+            "upper": ["NA", *upper],
+        },
+        index=[
+            "Exposed1 (-)",
+            *[f"Exposed{i+1} (+)" for i in range(1, len(est) + 1)]
+        ]
+    )
+
+
+def crosstab(
+    x: _np.ndarray, y: _np.ndarray, strata: _np.ndarray = None
+) -> tuple[tuple[_np.ndarray, ...], _np.ndarray]:
+    """Return a contingency table of counts from raw paired observations.
+
+    If `strata` is given, a stack of tables is returned, one per stratum
+    along the first axis, as used by the stratified analyses.
+
+    Args:
+        x: Row category of each observation, such as the exposure.
+        y: Column category of each observation, such as the disease.
+        strata: Stratum of each observation.
+
+    Returns:
+        Sorted levels of each variable, and the table of counts.
+    """
+    factors = [x, y] if strata is None else [strata, x, y]
+    levels, codes = zip(*(
+        _np.unique(_np.asarray(f), return_inverse=True) for f in factors
+    ))
+    shape = tuple(len(lvl) for lvl in levels)
+    # count each combination of codes in a single pass
+    flat = _np.ravel_multi_index(codes, shape)
+    counts = _np.bincount(flat, minlength=_np.prod(shape))
+    return levels, counts.reshape(shape)
 
 
 def riskratio(obs: _np.ndarray, alpha: float = 0.05) -> _pd.DataFrame:
@@ -30,26 +180,9 @@ def riskratio(obs: _np.ndarray, alpha: float = 0.05) -> _pd.DataFrame:
         Point and (1-alpha)% confidence interval estimates for\
         the relative risk.
     """
-    z: float = _st.norm().ppf(1-alpha/2)
-    a = obs[0, 1]
-    n1: int = _np.sum(obs[0])
-    df = _pd.DataFrame(index=["riskratio", "stderr", "lower", "upper"])
-    # add the reference category results
-    df["Exposed1 (-)"] = [1.0, 0.0, "NA", "NA"]
-    # gather results from array
-    for i in range(1, obs.shape[0]):
-        # get exposure results
-        c = obs[i, 1]
-        n2: int = _np.sum(obs[i])
-        # calculate the risk ratio
-        rr: float = (c/n2) / (a/n1)
-        stderr: float = _math.sqrt((1/a - 1/n1) +  (1/c - 1/n2))
-        ci: tuple[float, float] = (
-            rr * _math.exp(-z * stderr), rr * _math.exp(z * stderr)
-        )
-        # append to df
-        df[f"Exposed{i+1} (+)"] = [rr, stderr, ci[0], ci[1]]
-    return df.T
+    obs = _prepare(obs)
+    rr, stderr = _riskratios(obs)
+    return _ratio_frame("riskratio", rr, stderr, _z(alpha))
 
 
 def oddsratio(obs: _np.ndarray, alpha: float = 0.05) -> _pd.DataFrame:
@@ -63,37 +196,92 @@ def oddsratio(obs: _np.ndarray, alpha: float = 0.05) -> _pd.DataFrame:
         Point and (1-alpha)% confidence interval estimates for\
         the odds ratio.
     """
-    # gather results
-    z: float = _st.norm().ppf(1-alpha/2)
-    a: float = obs[0, 0]
-    b: float = obs[0, 1]
-    df = _pd.DataFrame(index=["oddsratio", "stderr", "lower", "upper"])
-    # add the reference category results
-    df["Exposed1 (-)"] = [1.0, 0.0, "NA", "NA"]
-    # gather results from array
-    for i in range(1, obs.shape[0]):
-        # get exposure results
-        c: float = obs[i, 0]
-        d: float = obs[i, 1]
-        # calculate the odds ratio
-        or_: float = (a * d) / (b * c)
-        stderr: float = _math.sqrt(1/a +  1/b + 1/c +  1/d)
-        ci: tuple[float, float] =(
-            or_ * _math.exp(-z * stderr), or_ * _math.exp(z * stderr)
-        )
-        # append to df
-        df[f"Exposed{i+1} (+)"] = [or_, stderr, ci[0], ci[1]]
-    return df.T 
+    obs = _prepare(obs)
+    or_, stderr = _oddsratios(obs)
+    return _ratio_frame("oddsratio", or_, stderr, _z(alpha))
+
+
+def riskratio_batch(obs: _np.ndarray, alpha: float = 0.05) -> _np.ndarray:
+    """Return the point and (1-alpha)% confidence interval estimates for
+    the relative risk of each table in a stack, such as bootstrap replicates.
+
+    Args:
+        obs: BxRx2 stack of contingency tables, each laid out as in\
+            `riskratio`.
+        alpha: Significance level for the confidence interval.
+
+    Returns:
+        BxR-1 structured array of the estimates for each exposure against\
+        the reference category, with fields `riskratio`, `stderr`,\
+        `lower` and `upper`.
+    """
+    rr, stderr = _riskratios(_prepare(obs))
+    return _ratio_records("riskratio", rr, stderr, _z(alpha))
+
+
+def oddsratio_batch(obs: _np.ndarray, alpha: float = 0.05) -> _np.ndarray:
+    """Return the point and (1-alpha)% confidence interval estimates for
+    the odds ratio of each table in a stack, such as bootstrap replicates.
+
+    Args:
+        obs: BxRx2 stack of contingency tables, each laid out as in\
+            `oddsratio`.
+        alpha: Significance level for the confidence interval.
+
+    Returns:
+        BxR-1 structured array of the estimates for each exposure against\
+        the reference category, with fields `oddsratio`, `stderr`,\
+        `lower` and `upper`.
+    """
+    or_, stderr = _oddsratios(_prepare(obs))
+    return _ratio_records("oddsratio", or_, stderr, _z(alpha))
 
 
 def expectedfreq(obs: _np.ndarray) -> _np.ndarray:
     """Return the expected frequencies from a contingency table under
     the hypothesis of no association.
 
+    For tables with more than two dimensions, this is the hypothesis of
+    mutual independence of all the variables.
+
     Returns:
         Expected frequencies.
     """
-    return _st.contingency.expected_freq(obs)
+    obs = _prepare(obs)
+    if obs.ndim < 2:
+        # a single variable has nothing to be associated with
+        return obs
+    # product of the margins over the grand total, once per extra dim
+    exp = 1.0
+    for axis in range(obs.ndim):
+        others = tuple(i for i in range(obs.ndim) if i != axis)
+        exp = exp * obs.sum(others, keepdims=True)
+    return exp / obs.sum() ** (obs.ndim - 1)
+
+
+def strata_expectedfreq(obs: _np.ndarray) -> _np.ndarray:
+    """Return the expected frequencies of each stratum of a Kx2x2 array
+    under the hypothesis of no association.
+
+    Each stratum is treated as its own table, with all K handled in one
+    pass.
+
+    Returns:
+        Expected frequencies of each stratum.
+    """
+    obs = _prepare(obs)
+    rowsums = obs.sum(-1, keepdims=True)
+    colsums = obs.sum(-2, keepdims=True)
+    return rowsums * colsums / obs.sum((-2, -1), keepdims=True)
+
+
+def _chisqcontribs(obs: _np.ndarray, exp: _np.ndarray) -> _np.ndarray:
+    """Return the chi-squared contributions of `obs` against `exp`."""
+    # work in place on the one residuals buffer
+    contribs = obs - exp
+    contribs *= contribs
+    contribs /= exp
+    return contribs
 
 
 def chisqcontribs(obs: _np.ndarray) -> _np.ndarray:
@@ -103,33 +291,45 @@ def chisqcontribs(obs: _np.ndarray) -> _np.ndarray:
     Returns:
         chi-squared contributions.
     """
-    exp = expectedfreq(obs)
-    contribs = _np.divide(_np.square(obs-exp), exp)
-    return contribs
+    obs = _prepare(obs)
+    return _chisqcontribs(obs, expectedfreq(obs))
+
+
+def strata_chisqcontribs(obs: _np.ndarray) -> _np.ndarray:
+    """Return the chi-squared contributions for each observation of each
+    stratum of a Kx2x2 array, testing each stratum for no association.
+
+    Returns:
+        chi-squared contributions of each stratum.
+    """
+    obs = _prepare(obs)
+    return _chisqcontribs(obs, strata_expectedfreq(obs))
 
 
-def chisqtest( obs: _np.ndarray) -> _pd.DataFrame:
+def chisqtest( obs: _np.ndarray) -> _dataclasses.ContingencyTest:
     """Return the results of a chi-squared test of no association.
 
     Returns:
         Results of a chi-squared test of no association.
     """
     res = _st.chi2_contingency(obs, correction=False)
-    df = _pd.DataFrame(index=["chisq", "pval", "df"])
-    df["result"] = [res[0], res[1], res[2]]
-    return df.T
+    return _dataclasses.ContingencyTest(
+        float(res[0]), float(res[1]), int(res[2])
+    )
 
 
 def aggregate(obs) -> _np.ndarray:
     """Return an aggregated array.
+
+    The strata are summed cell-wise, collapsing a Kx2x2 array into a
+    single 2x2 table.
     """
-    agg: _np.ndarray = _np.empty((2, 2))
-    for table in obs:
-        agg += table
-    return agg
+    return _np.asarray(obs).sum(0)
 
 
-def adjusted_oddsratio(obs: _np.ndarray, alpha: float = 0.05) -> _pd.DataFrame:
+def adjusted_oddsratio(
+    obs: _np.ndarray, alpha: float = 0.05
+) -> _dataclasses.OddsRatio:
     """Return the point and (1-alpha)% confidence interval estimates for
     the adjusted odds ratio.
 
@@ -142,22 +342,23 @@ def adjusted_oddsratio(obs: _np.ndarray, alpha: float = 0.05) -> _pd.DataFrame:
         Point and (1-alpha)% confidence interval estimates for\
         the adjusted odds ratio.
     """
-    strattable = _tables.StratifiedTable(obs.tolist())
-    est = strattable.oddsratio_pooled
-    stderr = strattable.logodds_pooled_se
-    ci = strattable.oddsratio_pooled_confint(alpha)
-    """
-    elif isinstance(table, OneToOneMatched):
-        est = table.table[0][1] /table.table[1][0]
-        se = (1/table.table[0][1] + 1/table.table[1][0]) ** 0.5
-        zscore = _st.norm.ppf(1-alpha/2)
-        ci = (est * _exp(-zscore * se), est * _exp(zscore * se))
-    else:
-        "Not defined for table type."
-    """
-    df = _pd.DataFrame(index=["oddsratio", "stderr", "lower", "upper"])
-    df["result"] = [est, stderr, ci[0], ci[1]]
-    return df.T
+    a, b, c, d, n = _strata_cells(obs)
+    # Mantel-Haenszel estimate, pooled over the strata
+    adn, bcn = a*d/n, b*c/n
+    r, s = adn.sum(), bcn.sum()
+    est = r / s
+    # Robins-Breslow-Greenland variance of the log-odds
+    p, q = (a+d)/n, (b+c)/n
+    var = (
+        (p*adn).sum() / (2 * r**2)
+        + (p*bcn + q*adn).sum() / (2*r*s)
+        + (q*bcn).sum() / (2 * s**2)
+    )
+    stderr = _math.sqrt(var)
+    lower, upper = _logratio_ci(est, stderr, _z(alpha))
+    return _dataclasses.OddsRatio(
+        float(est), float(stderr), float(lower), float(upper)
+    )
 
 
 def crude_oddsratio(obs: _np.ndarray, alpha: float = 0.05) -> _pd.DataFrame:
@@ -174,7 +375,7 @@ def crude_oddsratio(obs: _np.ndarray, alpha: float = 0.05) -> _pd.DataFrame:
     return oddsratio(aggregate(obs), alpha)
 
 
-def test_equalodds(obs: _np.ndarray) -> _pd.DataFrame:
+def test_equalodds(obs: _np.ndarray) -> _dataclasses.ChiSqTest:
     """Return the results test of the null hypothesis that the odds
     ratio is the same in all _k_ strata.
 
@@ -187,14 +388,12 @@ def test_equalodds(obs: _np.ndarray) -> _pd.DataFrame:
     Returns:
         test statistic and the p-value.
     """
-    strattable = _tables.StratifiedTable(obs.tolist())
+    strattable = _stratifiedtable(obs)
     res = strattable.test_equal_odds(True)
-    df = _pd.DataFrame(index=["chisq", "pval"])
-    df["result"] = [res.statistic, res.pvalue]
-    return df.T
+    return _dataclasses.ChiSqTest(float(res.statistic), float(res.pvalue))
 
 
-def test_nullodds(obs: _np.ndarray) -> _pd.DataFrame:
+def test_nullodds(obs: _np.ndarray) -> _dataclasses.ChiSqTest:
     """Return the results of a test of the null hypothesis of no
     association between the exposure and the disease, adjusted for the
     stratifying variable.
@@ -204,14 +403,18 @@ def test_nullodds(obs: _np.ndarray) -> _pd.DataFrame:
     Returns:
         test statistic and the p-value.
     """
-    strattable = _tables.StratifiedTable(obs.tolist())
-    res = strattable.test_null_odds(False)
-    df = _pd.DataFrame(index=["chisq", "pval"])
-    df["result"] = [res.statistic, res.pvalue]
-    return df.T
-
-
-def matched_oddsratio(obs: _np.ndarray, alpha: float = 0.05) -> _pd.DataFrame:
+    a, b, c, d, n = _strata_cells(obs)
+    # expected value and variance of the a-cell in each stratum under H0
+    exp = (a+b) * (a+c) / n
+    var = (a+b) * (c+d) * (a+c) * (b+d) / (n**2 * (n-1))
+    chisq = (a - exp).sum() ** 2 / var.sum()
+    pval = _chisq1_sf(chisq)
+    return _dataclasses.ChiSqTest(float(chisq), float(pval))
+
+
+def matched_oddsratio(
+    obs: _np.ndarray, alpha: float = 0.05
+) -> _dataclasses.MatchedOddsRatio:
     """Return the point and (1-alpha)% confidence interval estimates for
     the odds ratio in a 1-1 matched case-control study.
 
@@ -222,33 +425,36 @@ def matched_oddsratio(obs: _np.ndarray, alpha: float = 0.05) -> _pd.DataFrame:
         Point and (1-alpha)% confidence interval estimates for\
         the odds ratio.
     """
-    or_ = obs[1, 0] / obs[0, 1]
-    stderr = _math.sqrt(1/obs[1, 0] + 1/obs[0, 1])
-    z = _st.norm.ppf(1-alpha/2)
-    ci = (or_ * _math.exp(-z * stderr), or_ * _math.exp(z * stderr))
-    df = _pd.DataFrame(index=["oddsratio", "stderr", "lcb", "ucb"])
-    df["result"] = [or_, stderr, ci[0], ci[1]]
-    return df.T
+    f, g = float(obs[1, 0]), float(obs[0, 1])
+    or_ = f / g
+    stderr = _math.sqrt(1/f + 1/g)
+    # exp(-x) is 1/exp(x), so the one exp gives both bounds
+    factor = _math.exp(_z(alpha) * stderr)
+    return _dataclasses.MatchedOddsRatio(
+        or_, stderr, or_ / factor, or_ * factor
+    )
 
 
-def mcnemar(obs: _np.ndarray) -> _pd.DataFrame:
+def mcnemar(obs: _np.ndarray) -> _dataclasses.ChiSqTest:
     """Return the results of a test of the null hypothesis of no
     association in a 1-1 matched case-control study.
 
     This is the McNemar test.
 
+    Raises:
+        AssertionError: if there are no discordant pairs in `obs`
+
     Returns:
         test statistic and the p-value.
     """
     f = obs[1, 0]
     g = obs[0, 1]
+    assert f + g > 0, "There are no discordant pairs in obs"
     num = (abs(f-g) - 1) ** 2
     den = f + g
     chisq = num / den
-    pval = _st.chi2(df=1).sf(chisq)
-    df = _pd.DataFrame(index=["chisq", "pval"])
-    df["result"] = [chisq, pval]
-    return df.T
+    pval = _chisq1_sf(chisq)
+    return _dataclasses.ChiSqTest(float(chisq), float(pval))
 
 
 def odds(obs: _np.ndarray) -> _pd.DataFrame:
@@ -278,11 +484,10 @@ def doseexposure_odds(obs: _np.ndarray) -> _pd.DataFrame:
     """
 
     od = odds(obs)
-    log_od = _np.log(od)
-    df = _pd.DataFrame(index=["odds", "log-odds"])
-    for i in range(obs.shape[0]):
-        df[f"Exposed{i+1}"] = [od[i], log_od[i]]
-    return df.T 
+    return _pd.DataFrame(
+        {"odds": od, "log-odds": _np.log(od)},
+        index=[f"Exposed{i+1}" for i in range(obs.shape[0])]
+    )
 
 
 def midranks(obs: _np.ndarray) -> _np.ndarray:
@@ -297,87 +502,99 @@ def midranks(obs: _np.ndarray) -> _np.ndarray:
     Returns:
         Midranks of each dose to be used as the weighted scores.
     """
-    scores = _np.empty(shape=(obs.shape[0]))
     rowsums = obs.sum(1)
-    rowcounter = 0
-    for i in range(len(rowsums)):
-        scores[i] += (rowcounter + ((1 + rowsums[i]) / 2))
-        rowcounter += rowsums[i]
-    return scores
+    # number of observations ranked before each dose, plus its midpoint
+    return (_np.cumsum(rowsums) - rowsums) + ((1 + rowsums) / 2)
 
 
-def weighted_means(obs: _np.ndarray, scores: _np.ndarray) -> tuple[float, float]:
+def weighted_means(
+    obs: _np.ndarray, scores: _np.ndarray, n: float = None
+) -> tuple[float, float]:
     """Return the weighted row and column means of an Rx2 contingency table.
 
     Args:
         obs: Rx2 contingency table representing representing a\
             dose-response analysis.   
         scores: Weightings of each dose.
+        n: Total number of observations in `obs`, if already known.
 
     Returns:
         Weighted row mean, weighted col mean
     """
-    r, c = scores[0], scores[1]
-    ubar, vbar = 0, 0
-    for i in range(obs.shape[0]):
-        for j in range(obs.shape[1]):
-            ubar += ((r[i] * obs[i, j]) / obs.sum())
-            vbar += ((c[j] * obs[i, j]) / obs.sum())
+    r, c = _np.asarray(scores[0]), _np.asarray(scores[1])
+    if n is None:
+        n = obs.sum()
+    # weight each score by its row or column total
+    ubar = (r @ obs.sum(1)) / n
+    vbar = (obs.sum(0) @ c) / n
     return ubar, vbar
 
 
-def cov(obs: _np.ndarray, scores: _np.ndarray) -> float:
+def cov(
+    obs: _np.ndarray,
+    scores: _np.ndarray,
+    means: tuple[float, float] = None
+) -> float:
     """Return the covariance of an RxC array.
 
     Args:
         obs: Rx2 contingency table representing representing a\
             dose-response analysis.   
+        means: Weighted row and column means, if already known.
 
     Returns:
         Covariance of rows and columns.
     """
-    r, c = scores[0], scores[1]
-    rbar, cbar = weighted_means(obs, r, c)
-    cov = 0
-    for i in range(len(r)):
-        for j in range(len(c)):
-            cov += (r[i] - rbar) * (c[j] - cbar) * obs[i, j]
-    return cov
-
-
-def stddev(obs: _np.ndarray, scores: _np.ndarray) -> float:
+    r, c = _np.asarray(scores[0]), _np.asarray(scores[1])
+    if means is None:
+        means = weighted_means(obs, scores)
+    rbar, cbar = means
+    return _np.einsum("i,j,ij->", r - rbar, c - cbar, obs)
+
+
+def stddev(
+    obs: _np.ndarray,
+    scores: _np.ndarray,
+    means: tuple[float, float] = None
+) -> tuple[float, float]:
     """Return the standard deviation of the rows and columns.
 
     Args:
         obs: Rx2 contingency table representing representing a\
             dose-response analysis.   
+        means: Weighted row and column means, if already known.
 
     Returns:
         Covariance of rows and columns.
     """
-    r, c = scores[0], scores[1]
-    rbar, cbar = weighted_means(obs, scores)
-    rvar, cvar = 0, 0
-    for i in range(len(r)):
-        for j in range(len(c)):
-            rvar += (r[i] - rbar)**2 * obs[i, j]
-            cvar += (c[j] - cbar)**2 * obs[i, j]
+    r, c = _np.asarray(scores[0]), _np.asarray(scores[1])
+    if means is None:
+        means = weighted_means(obs, scores)
+    rbar, cbar = means
+    rvar = obs.sum(1) @ ((r - rbar) ** 2)
+    cvar = obs.sum(0) @ ((c - cbar) ** 2)
     return _math.sqrt(rvar), _math.sqrt(cvar)
 
 
-def corrcoeff(obs: _np.ndarray, scores: _np.ndarray) -> float:
+def corrcoeff(
+    obs: _np.ndarray, scores: _np.ndarray, n: float = None
+) -> float:
     """Return Pearson's correlation coefficients for an array.
 
     Args:
         obs: [description]
+        n: Total number of observations in `obs`, if already known.
 
     Returns:
         Pearson's correlation coefficient, r
     """
-    return cov(obs, scores) / (stddev(obs, scores)[0] * stddev(obs, scores)[1])
+    # share the weighted means between the covariance and the std devs
+    means = weighted_means(obs, scores, n)
+    rstd, cstd = stddev(obs, scores, means)
+    return cov(obs, scores, means) / (rstd * cstd)
 
 
-def chisq_lineartrend(obs: _np.ndarray) -> _pd.DataFrame:
+def chisq_lineartrend(obs: _np.ndarray) -> _dataclasses.ChiSqTest:
     """Return the test statistic and p-value for a chi-squared test
     of no linear trend.
 
@@ -388,18 +605,17 @@ def chisq_lineartrend(obs: _np.ndarray) -> _pd.DataFrame:
             analysis.
 
     Returns:
-        chi-square, p-value as a DataFrame.
+        chi-square, p-value.
     """
+    obs = _prepare(obs)
     # select the ranks => row score then col score
     scores = midranks(obs), [0, 1]
-    # gather results
-    r = corrcoeff(obs, scores)
-    chisq = (obs.sum() - 1) * (r ** 2)
-    pval = _st.chi2(df=1).sf(chisq)
-    # results to dataframe
-    df = _pd.DataFrame(index=["chisq", "pval"])
-    df["result"] = [chisq, pval]
-    return df.T
+    # gather results, totalling the observations once
+    n = obs.sum()
+    r = corrcoeff(obs, scores, n)
+    chisq = (n - 1) * (r ** 2)
+    pval = _chisq1_sf(chisq)
+    return _dataclasses.ChiSqTest(float(chisq), float(pval))
 
 
 def samplesize(
@@ -420,17 +636,17 @@ def samplesize(
         loss: estimated loss to follow-up as a percentage. Default is 0.0
 
     Returns:
-        Required sample size of each group, rounded to 6 dp.
+        Required sample size of each group.
     """
-    qsig = _st.norm().ppf(1-alpha/2)
-    qpow = _st.norm().ppf(gamma)
+    qsig = _z(alpha)
+    qpow = _NORM.ppf(gamma)
     prop_zero = 0.5 * (prop_treat + prop_cont)
     size = (
         2 * ((qsig + qpow) ** 2) * prop_zero * (1 - prop_zero)
         / ((prop_treat - prop_cont) ** 2)
     )
     adj: float = 1 / (1-(loss/100))
-    return round(size * adj, 6)
+    return float(size * adj)
 
 
 def power(
@@ -438,7 +654,7 @@ def power(
     alpha: float,
     prop_treat: float,
     prop_cont: float
-) -> int:
+) -> float:
     """Return the power available in trial with treatment, control groups\
         of a given size.
 
@@ -451,10 +667,10 @@ def power(
         prop_cont: Design value, estimated value of P(Disease|Control)
 
     Returns:
-        Power of the trial as a percentage, rounded to 6dp.
+        Power of the trial as a percentage.
     """
     prop_diff = abs(prop_treat - prop_cont)
     prop_zero = 0.5 * (prop_treat + prop_cont)
-    qsig = _st.norm().ppf(1-alpha/2)
+    qsig = _z(alpha)
     qpow = prop_diff * _math.sqrt(size / (2*prop_zero*(1-prop_zero))) - qsig
-    return round(100 * _st.norm().cdf(qpow), 6)
+    return float(100 * _NORM.cdf(qpow))